@@ -2,41 +2,114 @@
 Competitor analysis module
 """
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import copy
+import io
 import os
-from typing import Dict, Any, Optional
+from functools import cached_property
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+from ..data.competitor_data import read_competitor_research
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Template columns used by the analysis (only these are kept) and their dtypes
+ANALYSIS_DTYPES = {
+    'Competitor': 'string',
+    'Services': 'string',
+    'Pricing Range': 'string',
+    'Strengths': 'string',
+    'Weaknesses': 'string',
+    'Market Position': 'category'  # A handful of labels; value_counts bins small codes
+}
+
+# Comma-separated list columns and the per-row item count derived from each at load time
+TOKEN_COUNT_COLUMNS = {
+    'Strengths': 'Strength_Count',
+    'Weaknesses': 'Weakness_Count'
+}
+
+# Where generate_comparison_chart saves its chart
+COMPARISON_CHART_PATH = 'reports/competitor_strengths_comparison.png'
+
+def _count_items(values: pd.Series) -> pd.Series:
+    """
+    Counts the comma-separated items in each cell of a string column with the
+    vectorized .str kernels (no per-row Python callback). Blank or missing
+    cells count as 0.
+    """
+    values = values.str.strip().replace('', pd.NA)
+    return values.str.count(',').add(1).fillna(0).astype('int32')
+
+def _prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keeps the template columns used by the analysis, with their dtypes, and adds
+    the per-row item count of each comma-separated list column.
+    """
+    # Header cells may be padded with whitespace in hand-edited workbooks
+    df = df[[col for col in df.columns if str(col).strip() in ANALYSIS_DTYPES]]
+    df.columns = [str(col).strip() for col in df.columns]
+    df = df.astype({col: dtype for col, dtype in ANALYSIS_DTYPES.items() if col in df.columns})
+
+    # Count comma-separated items per competitor once
+    for col, count_col in TOKEN_COUNT_COLUMNS.items():
+        if col in df.columns:
+            df[count_col] = _count_items(df[col])
+    return df
 
 class CompetitorAnalysis:
     def __init__(self, data_file: str = 'data/competitor_research.xlsx'):
         """
-        Initializes the CompetitorAnalysis class.
+        Initializes the CompetitorAnalysis class. Data is loaded on first access to `df`.
 
         Args:
             data_file (str): Path to the competitor research Excel file.
         """
         self.data_file = data_file
-        self.df: Optional[pd.DataFrame] = None
-        self._load_data()
+        self._items: Dict[Tuple[int, str], pd.Series] = {}
+        self._strength_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        self.chart_png: Optional[bytes] = None  # PNG bytes of the last generated chart
+        self._figure: Optional['Figure'] = None  # Reused (cleared) across chart renders
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        """Competitor data, loaded on first access (empty if unavailable)."""
+        return self._load_data()
 
-    def _load_data(self) -> None:
-        """Loads competitor data from the specified Excel file."""
+    def _load_data(self) -> pd.DataFrame:
+        """Loads competitor data from the research workbook through the collector's shared loader."""
         try:
             if os.path.exists(self.data_file):
-                self.df = pd.read_excel(self.data_file)
-                # Basic data cleaning: strip whitespace from column names
-                self.df.columns = self.df.columns.str.strip()
+                # The shared loader hands each caller its own copy of the parse
+                df = _prepare_frame(read_competitor_research(self.data_file))
                 print(f"Competitor data loaded successfully from '{self.data_file}'.")
+                return df
             else:
                 print(f"Warning: Competitor data file '{self.data_file}' not found. Analysis will be limited.")
-                self.df = pd.DataFrame() # Ensure df is at least an empty DataFrame
+                return pd.DataFrame() # Ensure df is at least an empty DataFrame
         except FileNotFoundError:
             print(f"Error: Competitor data file '{self.data_file}' not found.")
-            self.df = pd.DataFrame()
+            return pd.DataFrame()
         except Exception as e:
             print(f"Error loading competitor data from {self.data_file}: {e}")
-            self.df = pd.DataFrame() # Ensure df is at least an empty DataFrame
+            return pd.DataFrame() # Ensure df is at least an empty DataFrame
+
+    def _tokenize_column(self, col: str) -> pd.Series:
+        """
+        Splits a comma-separated column into its stripped, non-blank items.
+
+        The split is done once per column and cached; the result is indexed by the
+        source row so it can be regrouped per competitor.
+        """
+        key = (id(self.df), col)
+        if key not in self._items:
+            # Drop items split from a previously assigned frame
+            self._items = {k: v for k, v in self._items.items() if k[0] == key[0]}
+            items = self.df[col].dropna().str.split(',').explode().str.strip()
+            self._items[key] = items[items.ne('')]
+        return self._items[key]
 
     def analyze_competitor_strengths(self) -> Dict[str, Any]:
         """
@@ -45,70 +118,115 @@ class CompetitorAnalysis:
         Returns:
             Dict[str, Any]: A dictionary containing analysis results.
         """
-        if self.df is None or self.df.empty:
+        # Results only depend on the loaded frame; reuse them until it is replaced.
+        # Callers get their own copy, so editing a result cannot corrupt the cache.
+        cache_key = (id(self.df), len(self.df))
+        if self._strength_cache is not None and self._strength_cache[0] == cache_key:
+            return copy.deepcopy(self._strength_cache[1])
+
+        if self.df.empty:
             print("No competitor data available for strength analysis.")
             return {
                 'total_competitors': 0,
                 'avg_strengths_per_competitor': 0,
+                'avg_weaknesses_per_competitor': 0,
                 'top_strengths': [],
                 'market_leaders': []
             }
 
-        # Count non-empty entries for strengths
-        strength_counts = self.df['Strengths'].str.split(',').str.len().fillna(0)
-        avg_strengths = strength_counts.mean() if not strength_counts.empty else 0
+        # Item counts were computed with the vectorized .str kernels at load time;
+        # the frame is non-empty here, so each mean is a single reduction
+        avg_strengths = float(self.df['Strength_Count'].mean())
+        avg_weaknesses = float(self.df['Weakness_Count'].mean()) if 'Weakness_Count' in self.df.columns else 0
         
         # Get top 5 strengths mentioned across competitors
-        all_strengths = []
-        for strengths in self.df['Strengths'].dropna():
-            all_strengths.extend([s.strip() for s in strengths.split(',')])
-        
-        top_strengths = pd.Series(all_strengths).value_counts().head(5).to_dict()
+        top_strengths = self._tokenize_column('Strengths').value_counts().head(5).to_dict()
         
         # Identify market leaders based on market position
         market_leaders = self.df['Market Position'].value_counts().head(3).to_dict()
         
-        return {
+        results = {
             'total_competitors': len(self.df),
             'avg_strengths_per_competitor': round(avg_strengths, 2),
+            'avg_weaknesses_per_competitor': round(avg_weaknesses, 2),
             'top_strengths': top_strengths,
             'market_leaders': market_leaders
         }
+        self._strength_cache = (cache_key, results)
+        return copy.deepcopy(results)
 
-    def generate_comparison_chart(self) -> Optional[str]:
+    def generate_comparison_chart(self, top_n: int = 10) -> Optional[str]:
         """
-        Generates a comparison chart of competitors by pricing range.
+        Generates a grouped bar chart of strengths and weaknesses for the competitors
+        listing the most strengths.
+        The rendered PNG is also kept in `chart_png` for callers that need the bytes.
+
+        Args:
+            top_n (int): Maximum number of competitors to include in the chart.
 
         Returns:
             Optional[str]: Path to the generated chart or None if failed.
         """
-        if self.df is None or self.df.empty:
+        if self.df.empty:
             print("No competitor data available for chart generation.")
             return None
 
-        # Filter out rows without pricing data
-        valid_df = self.df[self.df['Pricing Range'].notna() & (self.df['Pricing Range'] != '')]
-        
-        if valid_df.empty:
-            print("No valid pricing data available for chart generation.")
+        missing_columns = {'Competitor', 'Strengths'} - set(self.df.columns)
+        if missing_columns:
+            print(f"Missing competitor data columns for chart generation: {', '.join(sorted(missing_columns))}")
+            return None
+
+        # Rank only the count column; the rest of the frame is never copied or sorted
+        strength_counts = self.df['Strength_Count']
+        top_counts = strength_counts[strength_counts > 0].nlargest(top_n)
+
+        if top_counts.empty:
+            print("No strengths data available for chart generation.")
             return None
 
         try:
-            # Create bar chart of competitors by pricing range
-            plt.figure(figsize=(12, 6))
-            sns.barplot(x='Competitor', y='Pricing Range', data=valid_df)
-            plt.title('Competitor Pricing Range Comparison')
-            plt.xlabel('Competitor')
-            plt.ylabel('Pricing Range')
-            plt.xticks(rotation=45, ha='right')
-            
+            # At most top_n labels: a plain comprehension beats the .str accessor's dispatch
+            names = [c.strip() if isinstance(c, str) else '' for c in self.df.loc[top_counts.index, 'Competitor'].tolist()]
+            strengths = top_counts.to_numpy()
+            if 'Weakness_Count' in self.df.columns:
+                weaknesses = self.df.loc[top_counts.index, 'Weakness_Count'].to_numpy()
+            else:
+                weaknesses = np.zeros_like(strengths)
+
+            # Create grouped bar chart of strengths and weaknesses per competitor. A standalone
+            # Figure renders through Agg without pyplot state; it is kept and cleared for reuse.
+            if self._figure is None:
+                from matplotlib.figure import Figure  # Deferred: only chart generation needs matplotlib
+                self._figure = Figure(figsize=(12, 8))
+            fig = self._figure
+            fig.clf()
+            # Fixed margins (room for long competitor names) instead of an automatic layout pass
+            fig.subplots_adjust(left=0.22, right=0.97, top=0.93, bottom=0.08)
+            ax = fig.subplots()
+            positions = np.arange(len(names))
+            bar_height = 0.4
+            ax.barh(positions - bar_height/2, strengths, bar_height, label='Strengths', color='#4F81BD')
+            ax.barh(positions + bar_height/2, weaknesses, bar_height, label='Weaknesses', color='#C0504E')
+            ax.set_yticks(positions, names)
+            ax.invert_yaxis()  # Most strengths on top
+            ax.grid(True, axis='x', alpha=0.3)  # Light value grid, as seaborn's whitegrid theme gave
+            ax.set_axisbelow(True)
+            ax.legend(title='Attribute')
+            ax.set_title('Competitor Strengths and Weaknesses')
+            ax.set_xlabel('Number of Items Listed')
+            ax.set_ylabel('Competitor')
+
+            # Render once in memory; the same bytes are saved and kept in chart_png
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=100)
+            self.chart_png = buffer.getvalue()
+
             # Save chart
-            chart_path = 'reports/competitor_pricing_comparison.png'
-            os.makedirs('reports', exist_ok=True)
-            plt.tight_layout()
-            plt.savefig(chart_path)
-            plt.close()
-            
+            chart_path = COMPARISON_CHART_PATH
+            os.makedirs(os.path.dirname(chart_path), exist_ok=True)
+            with open(chart_path, 'wb') as f:
+                f.write(self.chart_png)
+
             return chart_path
         except Exception as e:
             print(f"Error generating competitor comparison chart: {e}")
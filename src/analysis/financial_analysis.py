@@ -2,17 +2,38 @@
 Financial analysis module for Location Festive Niort
 """
 
-import pandas as pd
+import copy
 import numpy as np
-from typing import Dict, Any, Tuple
-import json
-import os
+from functools import wraps
+from typing import Dict, Any, Optional, Tuple, Callable
+
+def _memoize_on(*assumption_attrs: str) -> Callable:
+    """
+    Caches a method's result per instance, keyed on the current values of the
+    given assumption dicts. Changing any of those values (e.g. during sensitivity
+    analysis) simply produces a new key, so no manual invalidation is needed.
+    Every call returns its own deep copy, so callers may edit the result freely.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self):
+            key = (method.__name__,) + tuple(
+                tuple(sorted(getattr(self, attr).items())) for attr in assumption_attrs
+            )
+            if key not in self._memo:
+                self._memo[key] = method(self)
+            return copy.deepcopy(self._memo[key])
+        return wrapper
+    return decorator
 
 class FinancialAnalyzer:
     def __init__(self):
         """
         Initializes the FinancialAnalyzer with default assumptions.
         """
+        # Results of memoized calculations, keyed on the assumptions they depend on
+        self._memo: Dict[Tuple, Any] = {}
+
         # Project Investment Assumptions
         self.development_costs = {
             'equipment_initial_purchase': 15000,
@@ -59,6 +80,7 @@ class FinancialAnalyzer:
             'year_3_growth_rate_annual': 20    # 20% annual growth
         }
 
+    @_memoize_on('development_costs', 'monthly_operating_costs')
     def calculate_total_investment(self) -> Dict[str, Any]:
         """
         Calculates the total initial investment required.
@@ -79,6 +101,7 @@ class FinancialAnalyzer:
             'total_year_1_investment': total_development + first_year_operating
         }
 
+    @_memoize_on('growth_assumptions', 'unit_economics')
     def project_revenue(self) -> Dict[str, Any]:
         """
         Projects revenue for 3 years under conservative, base, and optimistic scenarios.
@@ -86,26 +109,33 @@ class FinancialAnalyzer:
         Returns:
             Dict containing revenue projections
         """
-        # Base case calculations
-        base_customers = []
-        current_customers = self.growth_assumptions['year_1_monthly_customers_base']
+        return self._project_revenue(self.unit_economics)
+
+    def _project_revenue(self, unit_economics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Projects revenue as project_revenue() does, for the given unit economics.
         
-        # Year 1 monthly customers with growth
-        for month in range(1, 13):
-            base_customers.append(current_customers)
-            current_customers *= (1 + self.growth_assumptions['year_1_growth_rate_monthly']/100)
+        Args:
+            unit_economics: Unit economics assumptions to project with
+            
+        Returns:
+            Dict containing revenue projections
+        """
+        # Year 1 monthly customers with compounded monthly growth (months 0-11)
+        monthly_growth = 1 + self.growth_assumptions['year_1_growth_rate_monthly']/100
+        base_customers = self.growth_assumptions['year_1_monthly_customers_base'] * monthly_growth ** np.arange(12)
         
         # Year 2 and 3 annual customers
-        year_2_customers = base_customers[-1] * (1 + self.growth_assumptions['year_2_growth_rate_annual']/100)
+        year_2_customers = float(base_customers[-1]) * (1 + self.growth_assumptions['year_2_growth_rate_annual']/100)
         year_3_customers = year_2_customers * (1 + self.growth_assumptions['year_3_growth_rate_annual']/100)
         
         # Monthly revenue calculation
-        monthly_revenue_year_1 = [cust * self.unit_economics['avg_transaction_value'] for cust in base_customers]
+        monthly_revenue_year_1 = base_customers * unit_economics['avg_transaction_value']
         
         # Annual revenues
-        annual_revenue_year_1 = sum(monthly_revenue_year_1)
-        annual_revenue_year_2 = year_2_customers * self.unit_economics['avg_transaction_value'] * 12
-        annual_revenue_year_3 = year_3_customers * self.unit_economics['avg_transaction_value'] * 12
+        annual_revenue_year_1 = float(monthly_revenue_year_1.sum())
+        annual_revenue_year_2 = year_2_customers * unit_economics['avg_transaction_value'] * 12
+        annual_revenue_year_3 = year_3_customers * unit_economics['avg_transaction_value'] * 12
         
         # Scenarios (as percentages of base)
         conservative_factor = 0.7
@@ -113,8 +143,8 @@ class FinancialAnalyzer:
         
         return {
             'base_case': {
-                'year_1_monthly_customers': base_customers,
-                'year_1_monthly_revenue': monthly_revenue_year_1,
+                'year_1_monthly_customers': base_customers.tolist(),
+                'year_1_monthly_revenue': monthly_revenue_year_1.tolist(),
                 'annual_revenues': [
                     annual_revenue_year_1,
                     annual_revenue_year_2 * conservative_factor,  # More conservative in later years
@@ -167,59 +197,64 @@ class FinancialAnalyzer:
             'payback_period_months': payback_period_months
         }
 
-    def calculate_roi_metrics(self, investment: float, revenue_projections: dict) -> Dict[str, Any]:
+    def calculate_roi_metrics(self, investment: float, revenue_projections: dict,
+                              investment_summary: Optional[Dict[str, Any]] = None,
+                              unit_economics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Calculates ROI, break-even, NPV, and IRR.
         
         Args:
             investment: Initial investment amount
             revenue_projections: Revenue projections from project_revenue()
+            investment_summary: Result of calculate_total_investment(), computed if None
+            unit_economics: Unit economics assumptions, self.unit_economics if None
             
         Returns:
             Dict containing ROI metrics
         """
-        # Base case cash flows
-        base_revenues = revenue_projections['base_case']['annual_revenues']
-        operating_costs = self.calculate_total_investment()['first_year_operating_cost']
-        gross_margins = [rev * self.unit_economics['gross_margin_percentage']/100 for rev in base_revenues]
-        net_cash_flows = [-investment] + [gm - operating_costs for gm in gross_margins]
+        # Cost totals are invariant within this method
+        total_investment = investment_summary if investment_summary is not None else self.calculate_total_investment()
+        if unit_economics is None:
+            unit_economics = self.unit_economics
+        gross_margin_percentage = unit_economics['gross_margin_percentage']
+        operating_costs = total_investment['first_year_operating_cost']
+        monthly_operating_cost = total_investment['total_monthly_operating_cost']
+        development_cost = total_investment['total_development_cost']
+
+        # Base case cash flows (year 0 is the investment)
+        base_revenues = np.asarray(revenue_projections['base_case']['annual_revenues'], dtype=np.float64)
+        gross_margins = base_revenues * gross_margin_percentage/100
+        net_cash_flows = np.concatenate(([-investment], gross_margins - operating_costs))
         
         # Calculate cumulative cash flow for break-even
-        cumulative_cash_flow = [net_cash_flows[0]]
-        for i in range(1, len(net_cash_flows)):
-            cumulative_cash_flow.append(cumulative_cash_flow[i-1] + net_cash_flows[i])
-        
-        # Find break-even point
-        break_even_month = None
-        monthly_revenues = revenue_projections['base_case']['year_1_monthly_revenue']
-        monthly_costs = [self.calculate_total_investment()['total_monthly_operating_cost']] * 12
-        monthly_gross_margins = [rev * self.unit_economics['gross_margin_percentage']/100 for rev in monthly_revenues]
-        monthly_net_cash_flows = [gm - mc for gm, mc in zip(monthly_gross_margins, monthly_costs)]
-        cumulative_monthly = [-self.calculate_total_investment()['total_development_cost']]
-        
-        for i, net_cf in enumerate(monthly_net_cash_flows):
-            cumulative_monthly.append(cumulative_monthly[i] + net_cf)
-            if cumulative_monthly[i+1] >= 0 and break_even_month is None:
-                break_even_month = i + 1
+        cumulative_cash_flow = np.cumsum(net_cash_flows)
+        
+        # Find break-even point: first month where the cumulative cash flow is non-negative
+        monthly_revenues = np.asarray(revenue_projections['base_case']['year_1_monthly_revenue'])
+        monthly_gross_margins = monthly_revenues * gross_margin_percentage/100
+        monthly_net_cash_flows = monthly_gross_margins - monthly_operating_cost
+        cumulative_monthly = np.cumsum(np.concatenate(([-development_cost], monthly_net_cash_flows)))
+        break_even_reached = cumulative_monthly[1:] >= 0
+        break_even_month = int(np.argmax(break_even_reached)) + 1 if break_even_reached.any() else None
         
         # ROI calculations
-        total_return_1_year = net_cash_flows[1]
-        total_return_3_years = sum(net_cash_flows[1:])
+        total_return_1_year = float(net_cash_flows[1])
+        total_return_3_years = float(net_cash_flows[1:].sum())
         roi_1_year = (total_return_1_year / investment) * 100
         roi_3_years = (total_return_3_years / investment) * 100
         
         # NPV and IRR (simplified)
         discount_rate = 0.1  # 10% discount rate
-        npv = sum(cf / ((1 + discount_rate) ** t) for t, cf in enumerate(net_cash_flows))
+        npv = float(np.sum(net_cash_flows / (1 + discount_rate) ** np.arange(net_cash_flows.size)))
         
-        # Payback period
-        cumulative = 0
+        # Payback period: first year the cumulative cash flow is non-negative,
+        # interpolated within that year (0 if never reached)
         payback_period = 0
-        for i, cf in enumerate(net_cash_flows):
-            cumulative += cf
-            if cumulative >= 0:
-                payback_period = i + (abs(cumulative - cf) / cf) if cf != 0 else i
-                break
+        payback_reached = cumulative_cash_flow >= 0
+        if payback_reached.any():
+            i = int(np.argmax(payback_reached))
+            cf = float(net_cash_flows[i])
+            payback_period = i + (abs(float(cumulative_cash_flow[i]) - cf) / cf) if cf != 0 else i
         
         return {
             'break_even_month': break_even_month,
@@ -227,79 +262,108 @@ class FinancialAnalyzer:
             'roi_1_year': roi_1_year,
             'roi_3_years': roi_3_years,
             'npv': npv,
-            'cumulative_cash_flows': cumulative_cash_flow,
-            'monthly_cash_flows': monthly_net_cash_flows,
-            'cumulative_monthly_cash_flows': cumulative_monthly[1:]
+            'cumulative_cash_flows': cumulative_cash_flow.tolist(),
+            'monthly_cash_flows': monthly_net_cash_flows.tolist(),
+            'cumulative_monthly_cash_flows': cumulative_monthly[1:].tolist()
         }
 
-    def generate_cash_flow_projection(self) -> Dict[str, Any]:
+    def generate_cash_flow_projection(self, investment: Optional[Dict[str, Any]] = None,
+                                      revenue: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generates detailed monthly cash flow projections for Year 1.
         
+        Args:
+            investment: Result of calculate_total_investment(), computed if None
+            revenue: Result of project_revenue(), computed if None
+            
         Returns:
             Dict containing cash flow projections
         """
-        investment = self.calculate_total_investment()
-        revenue_proj = self.project_revenue()
+        if investment is None:
+            investment = self.calculate_total_investment()
+        revenue_proj = revenue if revenue is not None else self.project_revenue()
         
         # Monthly figures for Year 1
         monthly_revenues = revenue_proj['base_case']['year_1_monthly_revenue']
         fixed_monthly_costs = investment['total_monthly_operating_cost']
-        monthly_gross_margins = [rev * self.unit_economics['gross_margin_percentage']/100 for rev in monthly_revenues]
-        monthly_net_cash_flows = [gm - fixed_monthly_costs for gm in monthly_gross_margins]
+        monthly_gross_margins = np.asarray(monthly_revenues) * self.unit_economics['gross_margin_percentage']/100
+        monthly_net_cash_flows = monthly_gross_margins - fixed_monthly_costs
         
         # Add initial investment
         monthly_net_cash_flows[0] -= investment['total_development_cost']
         
         # Calculate running total
-        cumulative_cash_flow = [monthly_net_cash_flows[0]]
-        for i in range(1, len(monthly_net_cash_flows)):
-            cumulative_cash_flow.append(cumulative_cash_flow[i-1] + monthly_net_cash_flows[i])
+        cumulative_cash_flow = np.cumsum(monthly_net_cash_flows)
         
-        # Burn rate and runway
-        avg_monthly_negative_cash_flow = abs(sum([cf for cf in monthly_net_cash_flows if cf < 0]) / len([cf for cf in monthly_net_cash_flows if cf < 0]))
-        months_until_positive = next((i for i, cf in enumerate(cumulative_cash_flow) if cf >= 0), None)
+        # Burn rate (average of the negative months, 0 if none) and runway
+        negative_cash_flows = monthly_net_cash_flows[monthly_net_cash_flows < 0]
+        avg_monthly_negative_cash_flow = float(-negative_cash_flows.mean()) if negative_cash_flows.size else 0.0
+        positive_months = cumulative_cash_flow >= 0
+        months_until_positive = int(np.argmax(positive_months)) if positive_months.any() else None
         
         return {
-            'monthly_revenues': monthly_revenues,
+            'monthly_revenues': list(monthly_revenues),  # Not an alias of the revenue projection
             'monthly_costs': [fixed_monthly_costs] * 12,
-            'monthly_gross_margin': monthly_gross_margins,
-            'monthly_net_cash_flows': monthly_net_cash_flows,
-            'cumulative_cash_flow': cumulative_cash_flow,
+            'monthly_gross_margin': monthly_gross_margins.tolist(),
+            'monthly_net_cash_flows': monthly_net_cash_flows.tolist(),
+            'cumulative_cash_flow': cumulative_cash_flow.tolist(),
             'avg_burn_rate': avg_monthly_negative_cash_flow,
             'months_to_positive_cash_flow': months_until_positive
         }
 
-    def perform_sensitivity_analysis(self) -> Dict[str, Any]:
+    def _roi_with_unit_economics(self, investment: Dict[str, Any], **overrides: float) -> float:
+        """
+        Computes the 1-year ROI with some unit economics overridden. The overridden
+        copy is passed to the revenue and ROI calculations, so self.unit_economics
+        is never modified or rebound.
+        
+        Args:
+            investment: Result of calculate_total_investment()
+            **overrides: Unit economics values to replace
+            
+        Returns:
+            1-year ROI in percent
+        """
+        unit_economics = {**self.unit_economics, **overrides}
+        revenue = self._project_revenue(unit_economics)
+        return self.calculate_roi_metrics(investment['total_year_1_investment'], revenue,
+                                          investment, unit_economics)['roi_1_year']
+
+    def perform_sensitivity_analysis(self, investment: Optional[Dict[str, Any]] = None,
+                                     revenue: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Performs sensitivity analysis on key variables.
         
+        Args:
+            investment: Result of calculate_total_investment(), computed if None
+            revenue: Result of project_revenue() for the current assumptions, computed if None
+            
         Returns:
             Dict containing sensitivity analysis results
         """
-        base_revenue = self.project_revenue()['base_case']['annual_revenues'][0]
-        base_investment = self.calculate_total_investment()['total_year_1_investment']
-        base_roi = self.calculate_roi_metrics(base_investment, self.project_revenue())['roi_1_year']
-        
+        # Investment does not depend on CAC or churn: compute it once for every variation
+        if investment is None:
+            investment = self.calculate_total_investment()
+        if revenue is None:
+            revenue = self.project_revenue()
+        base_investment = investment['total_year_1_investment']
+        base_roi = self.calculate_roi_metrics(base_investment, revenue, investment)['roi_1_year']
+        
+        # Each variation is a few array operations; a worker pool would cost far more
+        # to start than the evaluations themselves, so they run in turn
         # Sensitivity to customer acquisition cost
         cac_variations = [20, 25, 30]  # ±20%
-        roi_cac_sensitivity = {}
-        for cac in cac_variations:
-            original_cac = self.unit_economics['customer_acquisition_cost']
-            self.unit_economics['customer_acquisition_cost'] = cac
-            new_roi = self.calculate_roi_metrics(base_investment, self.project_revenue())['roi_1_year']
-            roi_cac_sensitivity[f'CAC_{cac}'] = new_roi
-            self.unit_economics['customer_acquisition_cost'] = original_cac
+        roi_cac_sensitivity = {
+            f'CAC_{cac}': self._roi_with_unit_economics(investment, customer_acquisition_cost=cac)
+            for cac in cac_variations
+        }
             
         # Sensitivity to churn rate
         churn_variations = [3, 5, 7]  # ±40%
-        roi_churn_sensitivity = {}
-        for churn in churn_variations:
-            original_churn = self.unit_economics['monthly_churn_rate']
-            self.unit_economics['monthly_churn_rate'] = churn
-            new_roi = self.calculate_roi_metrics(base_investment, self.project_revenue())['roi_1_year']
-            roi_churn_sensitivity[f'Churn_{churn}%'] = new_roi
-            self.unit_economics['monthly_churn_rate'] = original_churn
+        roi_churn_sensitivity = {
+            f'Churn_{churn}%': self._roi_with_unit_economics(investment, monthly_churn_rate=churn)
+            for churn in churn_variations
+        }
             
         return {
             'base_roi': base_roi,
@@ -318,9 +382,9 @@ class FinancialAnalyzer:
         investment = self.calculate_total_investment()
         revenue = self.project_revenue()
         unit_economics = self.calculate_unit_economics()
-        roi_metrics = self.calculate_roi_metrics(investment['total_year_1_investment'], revenue)
-        cash_flow = self.generate_cash_flow_projection()
-        sensitivity = self.perform_sensitivity_analysis()
+        roi_metrics = self.calculate_roi_metrics(investment['total_year_1_investment'], revenue, investment)
+        cash_flow = self.generate_cash_flow_projection(investment, revenue)
+        sensitivity = self.perform_sensitivity_analysis(investment, revenue)
         
         return {
             'investment_summary': investment,
@@ -2,12 +2,18 @@
 Main market analysis module
 """
 
-import pandas as pd
-from .competitor_analysis import CompetitorAnalysis
+from .competitor_analysis import CompetitorAnalysis, COMPARISON_CHART_PATH
 from ..data.market_data import MarketDataHandler
 import os
 from typing import Dict, Any, Optional
 
+def _is_up_to_date(output_path: str, *input_paths: str) -> bool:
+    """Returns True if output_path exists and is at least as recent as every input file (a missing input counts as changed)."""
+    if not os.path.exists(output_path):
+        return False
+    output_mtime = os.path.getmtime(output_path)
+    return all(os.path.exists(path) and os.path.getmtime(path) <= output_mtime for path in input_paths)
+
 class MarketAnalyzer:
     def __init__(self):
         """
@@ -31,35 +37,53 @@ class MarketAnalyzer:
         competitor_results = self.competitor_analyzer.analyze_competitor_strengths()
         self.analysis_results["competitor_analysis"] = competitor_results
 
+        # A chart newer than the competitor data file is reused instead of redrawn
+        data_file = self.competitor_analyzer.data_file
+
         # Generate competitor comparison chart
-        competitor_chart_path = self.competitor_analyzer.generate_comparison_chart()
+        if _is_up_to_date(COMPARISON_CHART_PATH, data_file):
+            competitor_chart_path = COMPARISON_CHART_PATH
+            print(f"   ✓ Competitor comparison chart up to date: {competitor_chart_path}")
+        else:
+            competitor_chart_path = self.competitor_analyzer.generate_comparison_chart()
+            if competitor_chart_path:
+                print(f"   ✓ Competitor comparison chart saved: {competitor_chart_path}")
         if competitor_chart_path:
             self.analysis_results["competitor_comparison_chart"] = competitor_chart_path
-            print(f"   ✓ Competitor comparison chart saved: {competitor_chart_path}")
         else:
             self.analysis_results["competitor_comparison_chart"] = "Chart generation failed."
             print("   ✗ Competitor comparison chart generation failed.")
 
         # Step 2: Market Data Analysis and Preparation
-        print("  - Preparing market data...")
-        # Ensure data directory exists
-        if not os.path.exists('data'):
-            try:
-                os.makedirs('data')
-                print("   Created 'data' directory.")
-            except OSError as e:
-                print(f"   Error creating directory 'data': {e}")
-                self.analysis_results["market_data_status"] = "Failed to create data directory"
-                return self.analysis_results
-
-        # Create market summary Excel
-        market_excel_path = self.market_handler.create_market_summary_excel()
-        market_json_status = self.market_handler.save_market_data()
-
-        self.analysis_results["market_data_excel"] = market_excel_path
-        self.analysis_results["market_data_json"] = market_json_status
+        market_results = self._prepare_market_data()
+        self.analysis_results.update(market_results)
+        if "market_data_status" in market_results:
+            return self.analysis_results
 
         print("   ✓ Market data prepared successfully.")
         print("✓ Full market analysis completed.")
 
         return self.analysis_results
+
+    def _prepare_market_data(self) -> Dict[str, Any]:
+        """
+        Writes the market overview Excel and JSON files.
+
+        Returns:
+            Dict[str, Any]: Entries to add to the analysis results.
+        """
+        print("  - Preparing market data...")
+        # Ensure data directory exists (a no-op when it already does)
+        try:
+            os.makedirs('data', exist_ok=True)
+        except OSError as e:
+            print(f"   Error creating directory 'data': {e}")
+            return {"market_data_status": "Failed to create data directory"}
+
+        # Create market summary Excel and JSON
+        market_excel_path = self.market_handler.create_market_summary_excel()
+        _, market_json_status = self.market_handler.save_market_data()
+        return {
+            "market_data_excel": market_excel_path,
+            "market_data_json": market_json_status
+        }
@@ -2,82 +2,116 @@
 Main entry point for the Location Festive Niort Market Study project
 """
 
+import argparse
 import os
+from typing import Optional, Sequence
 from data.competitor_data import CompetitorDataCollector
 from data.market_data import MarketDataHandler
-from analysis.market_analysis import MarketAnalyzer
-from reports.generate_reports import generate_all_reports
 import json
 
-def main():
+# Steps main() can run, in execution order
+STEPS = ('templates', 'analysis', 'reports')
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command line options.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments to parse (sys.argv[1:] if None).
+
+    Returns:
+        argparse.Namespace: Parsed options; `steps` lists the steps to run.
+    """
+    parser = argparse.ArgumentParser(description="Location Festive Niort market study")
+    parser.add_argument('--steps', nargs='+', choices=STEPS, default=list(STEPS),
+                        help="Steps to run (default: all). Skipped steps reuse the files already on disk.")
+    return parser.parse_args(argv)
+
+def main(steps: Sequence[str] = STEPS):
     """
     Orchestrates the market study process from data setup to report generation.
+
+    Args:
+        steps (Sequence[str]): Which of STEPS to run; the others are skipped.
     """
     print("=== Location Festive Niort - Étude de Marché ===")
     print("Initialisation du projet...\n")
 
     # Ensure data and reports directories exist
     for dir_name in ['data', 'reports']:
-        if not os.path.exists(dir_name):
-            try:
-                os.makedirs(dir_name)
-                print(f"Created directory: {dir_name}")
-            except OSError as e:
-                print(f"Error creating directory {dir_name}: {e}")
-                # Depending on severity, you might want to exit or handle this more robustly
-                if dir_name == 'data':
-                    print("Critical error: Could not create data directory. Exiting.")
-                    return
-
-    # Step 1: Setup data collection templates and initial data
-    print("1. Configuration des modèles de collecte de données et données initiales...")
-
-    # Competitor Data Setup
-    competitor_collector = CompetitorDataCollector()
-    competitor_template_path = competitor_collector.create_competitor_template()
-    if competitor_template_path:
-        print(f"   ✓ Modèle de recherche concurrentielle créé à : {competitor_template_path}")
-    else:
-        print("   ✗ Échec de la création du modèle de recherche concurrentielle.")
-
-    # Market Data Setup
-    market_handler = MarketDataHandler()
-    market_excel_path = market_handler.create_market_summary_excel()
-    market_json_status = market_handler.save_market_data()
-
-    if market_excel_path and "saved successfully" in market_json_status:
-        print(f"   ✓ Modèles de données de marché créés et sauvegardés (Excel: {market_excel_path}, JSON status: {market_json_status}).")
-    else:
-        print(f"   ✓ Modèles de données de marché créés (Excel: {market_excel_path}, JSON status: {market_json_status}).")
-
-    # Step 2: Run market and competitor analysis
-    print("\n2. Analyse du marché et de la concurrence...")
-    analyzer = MarketAnalyzer()
-    analysis_results = analyzer.run_full_analysis() # Changed to capture results
-
-    if analysis_results:
-        print("   ✓ Analyse complète terminée.")
-        # You can print or process analysis_results here if needed
-        # print("\nAnalyse Results Summary:")
-        # print(json.dumps(analysis_results, indent=2))
-    else:
-        print("   ✗ L'analyse complète a échoué.")
-
-    # Step 3: Generate reports
-    print("\n3. Génération des rapports...")
-    excel_report_path, ppt_report_path = generate_all_reports()
-
-    if excel_report_path:
-        print(f"   ✓ Rapport Excel généré : {excel_report_path}")
-    else:
-        print("   ✗ Échec de la génération du rapport Excel.")
-
-    if ppt_report_path:
-        print(f"   ✓ Rapport PowerPoint généré : {ppt_report_path}")
-    else:
-        print("   ✗ Échec de la génération du rapport PowerPoint.")
+        try:
+            os.makedirs(dir_name, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating directory {dir_name}: {e}")
+            # Depending on severity, you might want to exit or handle this more robustly
+            if dir_name == 'data':
+                print("Critical error: Could not create data directory. Exiting.")
+                return
+
+    if 'templates' in steps:
+        # Step 1: Setup data collection templates and initial data
+        print("1. Configuration des modèles de collecte de données et données initiales...")
+
+        # Competitor Data Setup
+        competitor_collector = CompetitorDataCollector()
+        competitor_template_path = competitor_collector.create_competitor_template()
+        if competitor_template_path:
+            print(f"   ✓ Modèle de recherche concurrentielle créé à : {competitor_template_path}")
+        else:
+            print("   ✗ Échec de la création du modèle de recherche concurrentielle.")
+
+        # Export the collected competitor data to JSON
+        competitor_data = competitor_collector.load_competitor_data()
+        if competitor_data is not None:
+            competitor_json_saved, competitor_json_status = competitor_collector.save_competitor_data(competitor_data)
+            if competitor_json_saved:
+                print(f"   ✓ Données concurrentielles exportées : {competitor_json_status}")
+            else:
+                print(f"   ✗ Échec de l'export des données concurrentielles : {competitor_json_status}")
+
+        # Market Data Setup
+        market_handler = MarketDataHandler()
+        market_excel_path = market_handler.create_market_summary_excel()
+        market_json_saved, market_json_status = market_handler.save_market_data()
+
+        if market_excel_path and market_json_saved:
+            print(f"   ✓ Modèles de données de marché créés et sauvegardés (Excel: {market_excel_path}, JSON status: {market_json_status}).")
+        else:
+            print(f"   ✓ Modèles de données de marché créés (Excel: {market_excel_path}, JSON status: {market_json_status}).")
+
+    if 'analysis' in steps:
+        # Step 2: Run market and competitor analysis
+        print("\n2. Analyse du marché et de la concurrence...")
+        # Deferred: the analysis and report modules pull in pandas and matplotlib
+        from analysis.market_analysis import MarketAnalyzer
+        analyzer = MarketAnalyzer()
+        analysis_results = analyzer.run_full_analysis() # Changed to capture results
+
+        if analysis_results:
+            print("   ✓ Analyse complète terminée.")
+            # You can print or process analysis_results here if needed
+            # print("\nAnalyse Results Summary:")
+            # print(json.dumps(analysis_results, indent=2))
+        else:
+            print("   ✗ L'analyse complète a échoué.")
+
+    if 'reports' in steps:
+        # Step 3: Generate reports
+        print("\n3. Génération des rapports...")
+        from reports.generate_reports import generate_all_reports
+        excel_report_path, ppt_report_path = generate_all_reports()
+
+        if excel_report_path:
+            print(f"   ✓ Rapport Excel généré : {excel_report_path}")
+        else:
+            print("   ✗ Échec de la génération du rapport Excel.")
+
+        if ppt_report_path:
+            print(f"   ✓ Rapport PowerPoint généré : {ppt_report_path}")
+        else:
+            print("   ✗ Échec de la génération du rapport PowerPoint.")
 
     print("\n=== Étude de marché terminée. ===")
 
 if __name__ == "__main__":
-    main()
+    main(parse_args().steps)
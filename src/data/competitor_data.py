@@ -2,34 +2,156 @@
 Competitor data collection and management module
 """
 
-import pandas as pd
+from openpyxl import Workbook
+import datetime
 import json
 import os
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization, stdlib json is used otherwise
+    orjson = None
+
+# Competitors tracked in the research template (shared by every collector, never modified)
+COMPETITORS: Tuple[str, ...] = (
+    "LS Réception",
+    "Autrement Location",
+    "Organi-Sons",
+    "SR Événements",
+    "Au Comptoir Des Vaisselles",
+    "SIEG Event",
+    "Geste Scénique",
+    "AMB EVENT 79",
+    "Ouest Sono Live",
+    "Sonovolante",
+    "MAX MUSIQUE SA",
+    "Carrément Prod"
+)
+
+# Header of the competitor research template; every column after the first is left blank
+TEMPLATE_COLUMNS: Tuple[str, ...] = (
+    'Competitor',
+    'Website',
+    'Services',
+    'Pricing Range',
+    'Strengths',
+    'Weaknesses',
+    'Differentiation',
+    'Market Position',
+    'Social Media Presence'
+)
+_BLANK_FIELDS: Tuple[None, ...] = (None,) * (len(TEMPLATE_COLUMNS) - 1)
+
+def _json_default(value: Any) -> Any:
+    """
+    Encodes the values JSON has no type for, identically under orjson and the stdlib
+    encoder: missing markers (NaN, NaT, pd.NA) as null, NumPy scalars as the matching
+    Python value and dates as ISO 8601 text.
+
+    Raises:
+        TypeError: For any other type, instead of writing its text representation.
+    """
+    # Deferred: such values only come from pandas/NumPy, which are loaded by then
+    import numpy as np
+    import pandas as pd
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _mask_nan(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Replaces float NaN values in flat records with None (the stdlib encoder would write NaN literally)."""
+    return [
+        {key: None if isinstance(value, float) and value != value else value for key, value in record.items()}
+        for record in records
+    ]
+
+def _file_version(filepath: str) -> Tuple[str, Tuple[int, int, int]]:
+    """
+    Identifies the current version of a file by its absolute path and one os.stat:
+    modification time in nanoseconds, size and inode.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(filepath)
+    return os.path.abspath(filepath), (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+@lru_cache(maxsize=4)
+def _read_research_file(filepath: str, file_stat: Tuple[int, int, int]) -> 'pd.DataFrame':
+    """
+    Parses a competitor research workbook or its Parquet copy, once per file version
+    (absolute path plus the stat key from _file_version).
+
+    The returned DataFrame is shared between callers and must not be modified in place.
+    """
+    import pandas as pd  # Deferred: only loading needs pandas
+    if filepath.endswith('.parquet'):
+        return pd.read_parquet(filepath)
+    try:
+        return pd.read_excel(filepath, engine='calamine')
+    except (ImportError, ValueError):  # python-calamine not installed, or pandas < 2.2 without the engine
+        return pd.read_excel(filepath, engine='openpyxl')
+
+def read_competitor_research(template_filepath: str, parquet_filepath: Optional[str] = None) -> 'pd.DataFrame':
+    """
+    Reads competitor data from the research workbook, or from the given Parquet copy
+    written by save_competitor_data when that copy is at least as recent as the workbook.
+
+    This is the one loader shared by the collector and the analysis: each file is parsed
+    once per modification time, and every caller gets its own copy.
+
+    Args:
+        template_filepath (str): Path to the competitor research workbook.
+        parquet_filepath (Optional[str]): Path to its Parquet copy (the workbook
+            alone is read if None).
+
+    Returns:
+        pd.DataFrame: Competitor data.
+
+    Raises:
+        FileNotFoundError: If the research workbook does not exist.
+    """
+    # One stat per file: a missing file raises instead of being checked for first
+    template_version = _file_version(template_filepath)
+    parquet_version: Optional[Tuple[str, Tuple[int, int, int]]] = None
+    if parquet_filepath is not None:
+        try:
+            parquet_version = _file_version(parquet_filepath)
+        except FileNotFoundError:
+            pass
+
+    # Versions compare by modification time (the first stat field)
+    if parquet_version is not None and parquet_version[1][0] >= template_version[1][0]:
+        try:
+            return _read_research_file(*parquet_version).copy()
+        except ImportError:
+            pass  # No Parquet engine installed
+    return _read_research_file(*template_version).copy()
 
 class CompetitorDataCollector:
     def __init__(self):
         """
         Initializes the CompetitorDataCollector with a predefined list of competitors.
         """
-        self.competitors: List[str] = [
-            "LS Réception",
-            "Autrement Location",
-            "Organi-Sons",
-            "SR Événements",
-            "Au Comptoir Des Vaisselles",
-            "SIEG Event",
-            "Geste Scénique",
-            "AMB EVENT 79",
-            "Ouest Sono Live",
-            "Sonovolante",
-            "MAX MUSIQUE SA",
-            "Carrément Prod"
-        ]
+        self.competitors: Tuple[str, ...] = COMPETITORS
         self.data_dir: str = 'data'
         self.template_filepath: str = os.path.join(self.data_dir, 'competitor_research.xlsx')
         self.json_filepath: str = os.path.join(self.data_dir, 'competitor_data.json')
 
+    @property
+    def parquet_filepath(self) -> str:
+        """Path of the Parquet copy of saved data, named after the research workbook it belongs to."""
+        return os.path.splitext(self.template_filepath)[0] + '.parquet'
+
     def create_competitor_template(self) -> Optional[str]:
         """
         Creates a template Excel file for competitor data collection.
@@ -37,54 +159,112 @@ class CompetitorDataCollector:
         Returns:
             Optional[str]: The path to the created template file if successful, None otherwise.
         """
-        if not os.path.exists(self.data_dir):
-            try:
-                os.makedirs(self.data_dir)
-                print(f"Created directory: {self.data_dir}")
-            except OSError as e:
-                print(f"Error creating directory {self.data_dir}: {e}")
-                return None
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating directory {self.data_dir}: {e}")
+            return None
 
         # Check if template already exists to avoid overwriting without explicit intent
         if os.path.exists(self.template_filepath):
             print(f"Template file '{self.template_filepath}' already exists. Skipping creation.")
             return self.template_filepath
 
-        data = {
-            'Competitor': self.competitors,
-            'Website': [''] * len(self.competitors),
-            'Services': [''] * len(self.competitors),
-            'Pricing Range': [''] * len(self.competitors),
-            'Strengths': [''] * len(self.competitors),
-            'Weaknesses': [''] * len(self.competitors),
-            'Differentiation': [''] * len(self.competitors),
-            'Market Position': [''] * len(self.competitors),
-            'Social Media Presence': [''] * len(self.competitors)
-        }
-
         try:
-            df = pd.DataFrame(data)
-            df.to_excel(self.template_filepath, index=False)
+            # Stream the rows through a write-only workbook; the template is just a
+            # header plus one row per competitor, so no DataFrame is needed
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Sheet1')
+            worksheet.append(TEMPLATE_COLUMNS)
+            for competitor in self.competitors:
+                worksheet.append((competitor, *_BLANK_FIELDS))
+            workbook.save(self.template_filepath)
             print(f"Competitor research template created at: {self.template_filepath}")
             return self.template_filepath
         except Exception as e:
             print(f"Error creating competitor research template: {e}")
             return None
 
-    def load_competitor_data(self) -> Optional[pd.DataFrame]:
+    def load_competitor_data(self) -> Optional['pd.DataFrame']:
         """
-        Loads competitor data from the Excel file.
+        Loads competitor data from the Excel file, or from the Parquet copy written by
+        save_competitor_data when that copy is at least as recent as the Excel file.
 
         Returns:
             Optional[pd.DataFrame]: DataFrame with competitor data or None if failed.
         """
         try:
-            if os.path.exists(self.template_filepath):
-                df = pd.read_excel(self.template_filepath)
-                return df
-            else:
-                print(f"Competitor data file not found: {self.template_filepath}")
-                return None
+            return read_competitor_research(self.template_filepath, self.parquet_filepath)
+        except FileNotFoundError:
+            print(f"Competitor data file not found: {self.template_filepath}")
+            return None
         except Exception as e:
             print(f"Error loading competitor data: {e}")
             return None
+
+    def save_competitor_data(self, data: Union['pd.DataFrame', List[Dict[str, Any]]]) -> Tuple[bool, str]:
+        """
+        Saves competitor data to a JSON file, one record per competitor.
+
+        Args:
+            data (Union[pd.DataFrame, List[Dict[str, Any]]]): Competitor data, either a
+                DataFrame (e.g. from load_competitor_data()) or a list of records.
+
+        Returns:
+            Tuple[bool, str]: Whether the data was saved, and a status message.
+        """
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+
+            if isinstance(data, list):
+                # Records are serialized as given (NaN masked for the stdlib encoder);
+                # the frame only feeds the Parquet copy
+                import pandas as pd  # Deferred: only needed to build the Parquet copy
+                records = data if orjson is not None else _mask_nan(data)
+                df = pd.DataFrame.from_records(data)
+            elif orjson is not None:
+                # orjson writes NaN as null itself, so the records need no masking pass
+                df = data
+                records = df.to_dict(orient='records')
+            else:
+                # The stdlib encoder would write NaN literally: missing cells become None first
+                df = data
+                records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+            if orjson is not None:
+                payload = orjson.dumps(records, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                # allow_nan=False: any NaN left would be invalid JSON, so fail instead of writing it
+                payload = json.dumps(records, ensure_ascii=False, indent=2, default=_json_default,
+                                     allow_nan=False).encode('utf-8')
+
+            # The whole document is encoded up front and written in one call
+            with open(self.json_filepath, 'wb') as f:
+                f.write(payload)
+            self._write_parquet_copy(df)
+            return True, f"Competitor data saved successfully to {self.json_filepath}"
+        except Exception as e:
+            return False, f"Error saving competitor data: {e}"
+
+    def _write_parquet_copy(self, df: 'pd.DataFrame') -> None:
+        """
+        Writes saved competitor data as Parquet so load_competitor_data can skip the Excel parse.
+        If the copy cannot be written, any previous copy is removed so that loads fall back
+        to the workbook instead of serving older data.
+        """
+        temp_filepath = self.parquet_filepath + '.tmp'
+        try:
+            # Written aside and swapped in, so a failed write never leaves a partial copy
+            df.to_parquet(temp_filepath, index=False)
+            os.replace(temp_filepath, self.parquet_filepath)
+            return
+        except ImportError:
+            pass  # No Parquet engine installed
+        except Exception as e:
+            print(f"Warning: Could not write competitor data to '{self.parquet_filepath}': {e}")
+
+        for path in (temp_filepath, self.parquet_filepath):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -2,112 +2,173 @@
 Market data collection and management module
 """
 
-import pandas as pd
+from openpyxl import Workbook
+import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization, stdlib json is used otherwise
+    orjson = None
+
+# Static market information, shared by every handler (read-only; lists stored as tuples)
+MARKET_INFO: Mapping[str, Any] = MappingProxyType({
+    "industry": "Festive Equipment Rental",
+    "location": "Niort, France",
+    "target_market": (
+        "Wedding organizers",
+        "Corporate event planners",
+        "Schools and educational institutions",
+        "Municipalities for public events",
+        "Private party organizers"
+    ),
+    "seasonality_factors": (
+        "Spring/Summer: Weddings, outdoor events",
+        "Fall/Winter: Corporate events, holiday parties",
+        "Back-to-school season: School events"
+    ),
+    "market_trends": (
+        "Increasing demand for unique event experiences",
+        "Growing preference for locally-owned vs. chain providers",
+        "Importance of social media presence for marketing",
+        "Sustainability in event planning is gaining traction"
+    ),
+    "potential_opportunities": (
+        "Partnerships with local schools for fundraising events (leveraging APE contacts)",
+        "Sourcing unique machines directly from China for competitive pricing",
+        "Offering package deals for specific event types (e.g., birthdays, corporate picnics)"
+    ),
+    "challenges": (
+        "High initial investment for equipment",
+        "Seasonal demand fluctuations",
+        "Competition from established players",
+        "Logistics and maintenance of equipment"
+    )
+})
 
 class MarketDataHandler:
     def __init__(self):
         """
         Initializes the MarketDataHandler with predefined market information.
         """
-        self.market_info: Dict[str, Any] = {
-            "industry": "Festive Equipment Rental",
-            "location": "Niort, France",
-            "target_market": [
-                "Wedding organizers",
-                "Corporate event planners",
-                "Schools and educational institutions",
-                "Municipalities for public events",
-                "Private party organizers"
-            ],
-            "seasonality_factors": [
-                "Spring/Summer: Weddings, outdoor events",
-                "Fall/Winter: Corporate events, holiday parties",
-                "Back-to-school season: School events"
-            ],
-            "market_trends": [
-                "Increasing demand for unique event experiences",
-                "Growing preference for locally-owned vs. chain providers",
-                "Importance of social media presence for marketing",
-                "Sustainability in event planning is gaining traction"
-            ],
-            "potential_opportunities": [
-                "Partnerships with local schools for fundraising events (leveraging APE contacts)",
-                "Sourcing unique machines directly from China for competitive pricing",
-                "Offering package deals for specific event types (e.g., birthdays, corporate picnics)"
-            ],
-            "challenges": [
-                "High initial investment for equipment",
-                "Seasonal demand fluctuations",
-                "Competition from established players",
-                "Logistics and maintenance of equipment"
-            ]
-        }
+        self.market_info: Mapping[str, Any] = MARKET_INFO
         self.data_dir: str = 'data'
         self.market_overview_excel_path: str = os.path.join(self.data_dir, 'market_overview.xlsx')
         self.market_data_json_path: str = os.path.join(self.data_dir, 'market_data.json')
+        # Encoded market_info per `pretty`, with the mapping it was encoded from
+        self._json_payloads: Dict[bool, Tuple[Mapping[str, Any], bytes]] = {}
+        # Overview rows, with the mapping they were built from
+        self._overview_cache: Optional[Tuple[Mapping[str, Any], Tuple[Tuple[str, str], ...]]] = None
 
     def create_market_summary_excel(self) -> Optional[str]:
         """
-        Creates a summary Excel file with market information.
+        Creates a summary Excel file with market information. An existing file
+        written from the same rows (per its signature file) is reused as is.
 
         Returns:
             Optional[str]: Path to the created Excel file or None if failed.
         """
-        if not os.path.exists(self.data_dir):
-            try:
-                os.makedirs(self.data_dir)
-                print(f"Created directory: {self.data_dir}")
-            except OSError as e:
-                print(f"Error creating directory {self.data_dir}: {e}")
-                return None
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating directory {self.data_dir}: {e}")
+            return None
 
+        signature_path = self.market_overview_excel_path + '.sig'
+        signature = hashlib.blake2b(json.dumps(self._overview_rows).encode('utf-8'), digest_size=8).hexdigest()
         try:
-            # Create a DataFrame for market overview
-            overview_data = {
-                "Category": [
-                    "Industry",
-                    "Location",
-                    "Target Market",
-                    "Seasonality Factors",
-                    "Market Trends",
-                    "Opportunities",
-                    "Challenges"
-                ],
-                "Details": [
-                    self.market_info["industry"],
-                    self.market_info["location"],
-                    "\n".join(self.market_info["target_market"]),
-                    "\n".join(self.market_info["seasonality_factors"]),
-                    "\n".join(self.market_info["market_trends"]),
-                    "\n".join(self.market_info["potential_opportunities"]),
-                    "\n".join(self.market_info["challenges"])
-                ]
-            }
-
-            df = pd.DataFrame(overview_data)
-            df.to_excel(self.market_overview_excel_path, index=False)
+            with open(signature_path, encoding='utf-8') as f:
+                if f.read() == signature and os.path.exists(self.market_overview_excel_path):
+                    print(f"Market overview Excel up to date: {self.market_overview_excel_path}")
+                    return self.market_overview_excel_path
+        except FileNotFoundError:
+            pass
+
+        try:
+            # Stream the rows through a write-only workbook instead of DataFrame.to_excel
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Sheet1')
+            worksheet.append(("Category", "Details"))
+            for row in self._overview_rows:
+                worksheet.append(row)
+            workbook.save(self.market_overview_excel_path)
             print(f"Market overview Excel created at: {self.market_overview_excel_path}")
-            return self.market_overview_excel_path
         except Exception as e:
             print(f"Error creating market overview Excel: {e}")
             return None
 
-    def save_market_data(self) -> str:
+        try:
+            with open(signature_path, 'w', encoding='utf-8') as f:
+                f.write(signature)
+        except OSError as e:
+            print(f"Warning: Could not write market overview signature '{signature_path}': {e}")
+        return self.market_overview_excel_path
+
+    @property
+    def _overview_rows(self) -> Tuple[Tuple[str, str], ...]:
         """
-        Saves market data to a JSON file.
+        Market overview rows, built once per market_info mapping: one category per row,
+        list entries on separate lines. Assigning a new market_info rebuilds them.
+        """
+        if self._overview_cache is None or self._overview_cache[0] is not self.market_info:
+            rows = (
+                ("Industry", self.market_info["industry"]),
+                ("Location", self.market_info["location"]),
+                ("Target Market", "\n".join(self.market_info["target_market"])),
+                ("Seasonality Factors", "\n".join(self.market_info["seasonality_factors"])),
+                ("Market Trends", "\n".join(self.market_info["market_trends"])),
+                ("Opportunities", "\n".join(self.market_info["potential_opportunities"])),
+                ("Challenges", "\n".join(self.market_info["challenges"]))
+            )
+            self._overview_cache = (self.market_info, rows)
+        return self._overview_cache[1]
+
+    def _market_info_json(self, pretty: bool) -> bytes:
+        """
+        Market information encoded as JSON, once per layout and market_info mapping
+        (the mapping itself is read-only; assigning a new one re-encodes).
+        """
+        cached = self._json_payloads.get(pretty)
+        if cached is None or cached[0] is not self.market_info:
+            # orjson only indents by two spaces; the stdlib fallback matches it
+            if orjson is not None:
+                payload = orjson.dumps(dict(self.market_info), option=orjson.OPT_INDENT_2 if pretty else None)
+            elif pretty:
+                payload = json.dumps(dict(self.market_info), ensure_ascii=False, indent=2).encode('utf-8')
+            else:
+                payload = json.dumps(dict(self.market_info), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            self._json_payloads[pretty] = (self.market_info, payload)
+        return self._json_payloads[pretty][1]
+
+    def save_market_data(self, pretty: bool = True) -> Tuple[bool, str]:
+        """
+        Saves market data to a JSON file. A file that already holds the same
+        data is left untouched.
+
+        Args:
+            pretty (bool): Indent the JSON for reading; False writes it without
+                any whitespace, for files that are only machine-read.
 
         Returns:
-            str: Status message indicating success or failure.
+            Tuple[bool, str]: Whether the data was saved, and a status message.
         """
         try:
-            if not os.path.exists(self.data_dir):
-                os.makedirs(self.data_dir)
+            os.makedirs(self.data_dir, exist_ok=True)
+
+            payload = self._market_info_json(pretty)
+            try:
+                with open(self.market_data_json_path, 'rb') as f:
+                    if f.read() == payload:
+                        return True, f"Market data already up to date in {self.market_data_json_path}"
+            except FileNotFoundError:
+                pass
 
-            with open(self.market_data_json_path, 'w', encoding='utf-8') as f:
-                json.dump(self.market_info, f, ensure_ascii=False, indent=4)
-            return f"Market data saved successfully to {self.market_data_json_path}"
+            # The whole document is encoded up front and written in one call
+            with open(self.market_data_json_path, 'wb') as f:
+                f.write(payload)
+            return True, f"Market data saved successfully to {self.market_data_json_path}"
         except Exception as e:
-            return f"Error saving market data: {e}"
+            return False, f"Error saving market data: {e}"
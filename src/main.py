@@ -19,15 +19,13 @@ def main():
 
     # Ensure data and reports directories exist
     for dir_name in ['data', 'reports']:
-        if not os.path.exists(dir_name):
-            try:
-                os.makedirs(dir_name)
-                print(f"Created directory: {dir_name}")
-            except OSError as e:
-                print(f"Error creating directory {dir_name}: {e}")
-                if dir_name == 'data':
-                    print("Critical error: Could not create data directory. Exiting.")
-                    return
+        try:
+            os.makedirs(dir_name, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating directory {dir_name}: {e}")
+            if dir_name == 'data':
+                print("Critical error: Could not create data directory. Exiting.")
+                return
 
     # Step 1: Setup data collection templates and initial data
     print("1. Configuration des modèles de collecte de données et données initiales...")
@@ -40,12 +38,21 @@ def main():
     else:
         print("   ✗ Échec de la création du modèle de recherche concurrentielle.")
 
+    # Export the collected competitor data to JSON
+    competitor_data = competitor_collector.load_competitor_data()
+    if competitor_data is not None:
+        competitor_json_saved, competitor_json_status = competitor_collector.save_competitor_data(competitor_data)
+        if competitor_json_saved:
+            print(f"   ✓ Données concurrentielles exportées : {competitor_json_status}")
+        else:
+            print(f"   ✗ Échec de l'export des données concurrentielles : {competitor_json_status}")
+
     # Market Data Setup
     market_handler = MarketDataHandler()
     market_excel_path = market_handler.create_market_summary_excel()
-    market_json_status = market_handler.save_market_data()
+    market_json_saved, market_json_status = market_handler.save_market_data()
 
-    if market_excel_path and "saved successfully" in market_json_status:
+    if market_excel_path and market_json_saved:
         print(f"   ✓ Modèles de données de marché créés et sauvegardés (Excel: {market_excel_path}, JSON status: {market_json_status}).")
     else:
         print(f"   ✗ Échec de la création des modèles de données de marché.")
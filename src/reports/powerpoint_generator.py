@@ -106,11 +106,13 @@ class MarketStudyPresentation:
                 paragraph.font.size = Pt(16)
                 paragraph.alignment = PP_ALIGN.CENTER
         
-        # Fill in data
-        for i, row in df.iterrows():
-            for j, value in enumerate(row):
-                cell = table.cell(i + 1, j)
-                cell.text = str(value) if pd.notna(value) else ""
+        # Fill in data: cell texts are converted for the whole frame at once (missing
+        # values shown empty) and placed by position, whatever the frame's index
+        cell_texts = df.astype(object).where(df.notna(), "").astype(str).to_numpy().tolist()
+        for i, row in enumerate(cell_texts, start=1):
+            for j, text in enumerate(row):
+                cell = table.cell(i, j)
+                cell.text = text
                 for paragraph in cell.text_frame.paragraphs:
                     paragraph.font.size = Pt(14)
 
@@ -0,0 +1,21 @@
+import os
+import tempfile
+import unittest
+
+class ScratchDirTestCase(unittest.TestCase):
+    """Runs each test from its own empty temporary directory.
+
+    The pipeline writes relative data/ and reports/ paths, so tests that run it
+    must not touch the checkout they are started from.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.original_dir = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        self.tmp_dir.cleanup()
+        super().tearDown()
@@ -1,5 +1,23 @@
+import os
 import unittest
-from src.analysis.competitor_analysis import CompetitorAnalysis
+from unittest import mock
+import pandas as pd
+from src.analysis.competitor_analysis import CompetitorAnalysis, COMPARISON_CHART_PATH
+from src.analysis.market_analysis import MarketAnalyzer
+from src.analysis.financial_analysis import FinancialAnalyzer
+from src.data.competitor_data import CompetitorDataCollector
+from src.test.support import ScratchDirTestCase
+
+def write_research_file(path, competitors):
+    """Writes a small competitor research workbook with one row per competitor name."""
+    pd.DataFrame({
+        "Competitor": competitors,
+        "Services": ["Sono, Lumière"] * len(competitors),
+        "Pricing Range": ["€€"] * len(competitors),
+        "Strengths": ["Prix, Choix"] * len(competitors),
+        "Weaknesses": ["Délais"] * len(competitors),
+        "Market Position": ["Leader"] * len(competitors)
+    }).to_excel(path, index=False)
 
 class TestCompetitorAnalysis(unittest.TestCase):
     def setUp(self):
@@ -41,5 +59,120 @@ class TestCompetitorAnalysis(unittest.TestCase):
         analysis._load_data()
         self.assertIsNone(analysis.df)
 
+class TestCompetitorAnalysisSharedData(ScratchDirTestCase):
+    def setUp(self):
+        super().setUp()
+        os.makedirs("data")
+        self.test_file = os.path.join("data", "competitor_research.xlsx")
+        write_research_file(self.test_file, ["A", "B"])
+
+    def test_instances_do_not_share_mutations(self):
+        first = CompetitorAnalysis(self.test_file)
+        second = CompetitorAnalysis(self.test_file)
+        first.df.loc[0, "Strengths"] = "mutated"
+        self.assertEqual(second.df.loc[0, "Strengths"], "Prix, Choix")
+        self.assertEqual(CompetitorAnalysis(self.test_file).df.loc[0, "Strengths"], "Prix, Choix")
+
+    def test_cached_strength_results_are_not_shared(self):
+        analysis = CompetitorAnalysis(self.test_file)
+        results = analysis.analyze_competitor_strengths()
+        results['top_strengths']['Prix'] = -1
+        results['total_competitors'] = -1
+        again = analysis.analyze_competitor_strengths()
+        self.assertEqual(again['top_strengths']['Prix'], 2)
+        self.assertEqual(again['total_competitors'], 2)
+
+    def test_reads_only_the_research_workbook(self):
+        collector = CompetitorDataCollector()
+        df = collector.load_competitor_data()
+        df.loc[0, "Competitor"] = "Renamed"
+        saved, status = collector.save_competitor_data(df)
+        self.assertTrue(saved, status)
+        self.assertEqual(CompetitorAnalysis(self.test_file).df.loc[0, "Competitor"], "A")
+
+class TestMarketAnalyzerOutputReuse(ScratchDirTestCase):
+    def setUp(self):
+        super().setUp()
+        os.makedirs("data")
+        self.data_file = os.path.join("data", "competitor_research.xlsx")
+        write_research_file(self.data_file, ["A", "B"])
+
+    def run_analysis(self):
+        """Runs the full analysis and returns how many times the chart was drawn."""
+        with mock.patch.object(CompetitorAnalysis, 'generate_comparison_chart', autospec=True,
+                               side_effect=CompetitorAnalysis.generate_comparison_chart) as draw_chart:
+            results = MarketAnalyzer().run_full_analysis()
+        self.assertEqual(results["competitor_comparison_chart"], COMPARISON_CHART_PATH)
+        return draw_chart.call_count
+
+    def set_mtime(self, path, mtime):
+        os.utime(path, (mtime, mtime))
+
+    def test_chart_reused_while_newer_than_data(self):
+        self.assertEqual(self.run_analysis(), 1)
+        chart_mtime = os.path.getmtime(self.data_file) + 10
+        self.set_mtime(COMPARISON_CHART_PATH, chart_mtime)
+        self.assertEqual(self.run_analysis(), 0)
+        self.assertEqual(os.path.getmtime(COMPARISON_CHART_PATH), chart_mtime)
+
+    def test_chart_regenerated_when_data_changes(self):
+        self.assertEqual(self.run_analysis(), 1)
+        self.set_mtime(self.data_file, os.path.getmtime(COMPARISON_CHART_PATH) + 10)
+        self.assertEqual(self.run_analysis(), 1)
+
+    def test_chart_reused_when_only_exported_data_changes(self):
+        self.assertEqual(self.run_analysis(), 1)
+        collector = CompetitorDataCollector()
+        collector.save_competitor_data(collector.load_competitor_data())
+        self.set_mtime(collector.parquet_filepath, os.path.getmtime(COMPARISON_CHART_PATH) + 10)
+        self.assertEqual(self.run_analysis(), 0)
+
+    def test_chart_regenerated_when_missing(self):
+        self.assertEqual(self.run_analysis(), 1)
+        os.remove(COMPARISON_CHART_PATH)
+        self.assertEqual(self.run_analysis(), 1)
+        self.assertTrue(os.path.exists(COMPARISON_CHART_PATH))
+
+class TestFinancialAnalyzerMemo(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = FinancialAnalyzer()
+
+    def test_changed_assumptions_invalidate_memo(self):
+        first = self.analyzer.calculate_total_investment()['total_development_cost']
+        self.analyzer.development_costs['software_development'] += 1000
+        self.assertEqual(self.analyzer.calculate_total_investment()['total_development_cost'], first + 1000)
+
+        base_revenue = sum(self.analyzer.project_revenue()['base_case']['annual_revenues'])
+        self.analyzer.unit_economics['avg_transaction_value'] *= 2
+        self.assertAlmostEqual(sum(self.analyzer.project_revenue()['base_case']['annual_revenues']), base_revenue * 2)
+
+    def test_editing_results_does_not_corrupt_memo(self):
+        results = self.analyzer.run_full_financial_analysis()
+        expected_total = self.analyzer.calculate_total_investment()['total_development_cost']
+        expected_revenues = list(self.analyzer.project_revenue()['base_case']['annual_revenues'])
+
+        results['investment_summary']['total_development_cost'] = -1
+        results['revenue_projections']['base_case']['annual_revenues'].append(0)
+
+        self.assertEqual(self.analyzer.calculate_total_investment()['total_development_cost'], expected_total)
+        self.assertEqual(self.analyzer.project_revenue()['base_case']['annual_revenues'], expected_revenues)
+
+    def test_cash_flow_revenues_do_not_alias_revenue_projection(self):
+        results = self.analyzer.run_full_financial_analysis()
+        expected_revenues = list(results['revenue_projections']['base_case']['year_1_monthly_revenue'])
+
+        results['cash_flow_projection']['monthly_revenues'][0] = -1
+
+        self.assertEqual(results['revenue_projections']['base_case']['year_1_monthly_revenue'], expected_revenues)
+
+    def test_sensitivity_analysis_leaves_assumptions_untouched(self):
+        unit_economics_dict = self.analyzer.unit_economics
+        unit_economics = dict(unit_economics_dict)
+        revenue_before = self.analyzer.project_revenue()
+        self.analyzer.perform_sensitivity_analysis()
+        self.assertIs(self.analyzer.unit_economics, unit_economics_dict)
+        self.assertEqual(self.analyzer.unit_economics, unit_economics)
+        self.assertEqual(self.analyzer.project_revenue(), revenue_before)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+# app.py imports its siblings as top-level packages (data, analysis, reports)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app
+from src.test.support import ScratchDirTestCase
+
+class TestAppSteps(ScratchDirTestCase):
+
+    def test_parse_args_defaults_to_all_steps(self):
+        self.assertEqual(app.parse_args([]).steps, list(app.STEPS))
+
+    def test_parse_args_selected_steps(self):
+        self.assertEqual(app.parse_args(['--steps', 'templates', 'reports']).steps, ['templates', 'reports'])
+
+    def test_parse_args_rejects_unknown_step(self):
+        with self.assertRaises(SystemExit):
+            app.parse_args(['--steps', 'charts'])
+
+    def test_templates_step_only(self):
+        app.main(steps=['templates'])
+        self.assertTrue(os.path.exists(os.path.join('data', 'competitor_research.xlsx')))
+        self.assertTrue(os.path.exists(os.path.join('data', 'market_overview.xlsx')))
+        # Skipped analysis and report steps leave reports/ empty
+        self.assertEqual(os.listdir('reports'), [])
+
+    def test_no_steps_only_creates_directories(self):
+        app.main(steps=[])
+        self.assertEqual(os.listdir('data'), [])
+        self.assertEqual(os.listdir('reports'), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,13 @@
+import json
+import os
 import unittest
-from src.data.competitor_data import CompetitorDataCollector
+from unittest import mock
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from src.data.competitor_data import CompetitorDataCollector, COMPETITORS
+from src.data.market_data import MarketDataHandler, MARKET_INFO
+from src.test.support import ScratchDirTestCase
 
 class TestCompetitorData(unittest.TestCase):
     def setUp(self):
@@ -41,5 +49,186 @@ class TestCompetitorData(unittest.TestCase):
         result = self.collector.create_competitor_template()
         self.assertIsNone(result)
 
+class TestCompetitorDataSaveLoad(ScratchDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.collector = CompetitorDataCollector()
+
+    def test_template_data_exported_to_json(self):
+        self.collector.create_competitor_template()
+        saved, status = self.collector.save_competitor_data(self.collector.load_competitor_data())
+        self.assertTrue(saved, status)
+        with open(self.collector.json_filepath, encoding='utf-8') as f:
+            records = json.load(f)
+        self.assertEqual([record['Competitor'] for record in records], list(COMPETITORS))
+        self.assertIsNone(records[0]['Website'])
+
+    def test_load_prefers_newer_parquet_copy(self):
+        self.collector.create_competitor_template()
+        self.collector.save_competitor_data([{'Competitor': 'Saved', 'Score': 1}])
+        self.assertEqual(self.collector.load_competitor_data()['Competitor'].tolist(), ['Saved'])
+
+    def test_load_falls_back_to_newer_workbook(self):
+        self.collector.create_competitor_template()
+        self.collector.save_competitor_data([{'Competitor': 'Saved', 'Score': 1}])
+        parquet_mtime = os.path.getmtime(self.collector.parquet_filepath)
+        os.utime(self.collector.template_filepath, (parquet_mtime + 10, parquet_mtime + 10))
+        self.assertEqual(self.collector.load_competitor_data()['Competitor'].tolist(), list(COMPETITORS))
+
+    def test_load_falls_back_to_workbook_without_parquet_copy(self):
+        self.collector.create_competitor_template()
+        self.assertFalse(os.path.exists(self.collector.parquet_filepath))
+        self.assertEqual(self.collector.load_competitor_data()['Competitor'].tolist(), list(COMPETITORS))
+
+    def test_load_falls_back_to_openpyxl_when_calamine_is_unknown(self):
+        self.collector.create_competitor_template()
+        read_excel = pd.read_excel
+
+        def read_excel_without_calamine(path, engine=None, **kwargs):
+            if engine == 'calamine':
+                raise ValueError("Unknown engine: calamine")  # As raised by pandas < 2.2
+            return read_excel(path, engine=engine, **kwargs)
+
+        with mock.patch('pandas.read_excel', side_effect=read_excel_without_calamine):
+            df = self.collector.load_competitor_data()
+        self.assertEqual(df['Competitor'].tolist(), list(COMPETITORS))
+
+    def test_other_workbook_ignores_newer_parquet_copy(self):
+        self.collector.create_competitor_template()
+        self.collector.save_competitor_data([{'Competitor': 'Saved', 'Score': 1}])
+
+        other = CompetitorDataCollector()
+        other.template_filepath = os.path.join(other.data_dir, 'other_research.xlsx')
+        pd.DataFrame({'Competitor': ['Other']}).to_excel(other.template_filepath, index=False)
+        parquet_mtime = os.path.getmtime(self.collector.parquet_filepath)
+        os.utime(other.template_filepath, (parquet_mtime - 10, parquet_mtime - 10))
+
+        self.assertNotEqual(other.parquet_filepath, self.collector.parquet_filepath)
+        self.assertEqual(other.load_competitor_data()['Competitor'].tolist(), ['Other'])
+
+    def test_same_relative_path_in_another_directory_is_reread(self):
+        self.collector.create_competitor_template()
+        first_stat = os.stat(self.collector.template_filepath)
+        self.assertEqual(self.collector.load_competitor_data()['Competitor'].tolist(), list(COMPETITORS))
+
+        # Same relative path and modification time, different working directory
+        os.makedirs(os.path.join('other', 'data'))
+        os.chdir('other')
+        pd.DataFrame({'Competitor': ['Elsewhere']}).to_excel(self.collector.template_filepath, index=False)
+        os.utime(self.collector.template_filepath, ns=(first_stat.st_atime_ns, first_stat.st_mtime_ns))
+        self.assertEqual(self.collector.load_competitor_data()['Competitor'].tolist(), ['Elsewhere'])
+
+    def test_failed_parquet_write_removes_stale_copy(self):
+        self.collector.create_competitor_template()
+        self.collector.save_competitor_data([{'Competitor': 'OLD', 'Score': 1}])
+        # Mixed int/str column: Parquet cannot store it, JSON can
+        saved, status = self.collector.save_competitor_data(
+            [{'Competitor': 'NEW', 'Score': 1}, {'Competitor': 'NEW2', 'Score': 'high'}])
+        self.assertTrue(saved, status)
+        self.assertFalse(os.path.exists(self.collector.parquet_filepath))
+        self.assertNotIn('OLD', self.collector.load_competitor_data()['Competitor'].tolist())
+
+    def save_and_read_json(self, data):
+        """Saves data and returns the raw bytes of the JSON file."""
+        saved, status = self.collector.save_competitor_data(data)
+        self.assertTrue(saved, status)
+        with open(self.collector.json_filepath, 'rb') as f:
+            return f.read()
+
+    def test_records_with_numpy_and_missing_values(self):
+        records = [{'Competitor': 'A', 'Score': np.int64(3), 'Share': np.float64(0.5),
+                    'Gap': float('nan'), 'Since': pd.NaT}]
+        expected = [{'Competitor': 'A', 'Score': 3, 'Share': 0.5, 'Gap': None, 'Since': None}]
+        payload = self.save_and_read_json(records)
+        self.assertEqual(json.loads(payload), expected)
+        # The stdlib fallback writes the same valid JSON (no literal NaN)
+        with mock.patch('src.data.competitor_data.orjson', None):
+            self.assertEqual(self.save_and_read_json(records), payload)
+
+    def test_unknown_types_are_rejected(self):
+        saved, _ = self.collector.save_competitor_data([{'Competitor': 'A', 'Contact': object()}])
+        self.assertFalse(saved)
+        with mock.patch('src.data.competitor_data.orjson', None):
+            saved, _ = self.collector.save_competitor_data([{'Competitor': 'A', 'Contact': object()}])
+        self.assertFalse(saved)
+
+class TestMarketOverviewReuse(ScratchDirTestCase):
+    def create_overview(self, handler=None):
+        """Creates the market overview and returns whether the workbook was (re)written."""
+        handler = handler or MarketDataHandler()
+        with mock.patch('src.data.market_data.Workbook', wraps=Workbook) as workbook:
+            path = handler.create_market_summary_excel()
+        self.assertEqual(path, handler.market_overview_excel_path)
+        return workbook.called
+
+    def test_unchanged_overview_is_reused(self):
+        self.assertTrue(self.create_overview())
+        self.assertTrue(os.path.exists(os.path.join('data', 'market_overview.xlsx.sig')))
+        self.assertFalse(self.create_overview())
+
+    def test_changed_market_info_regenerates(self):
+        self.assertTrue(self.create_overview())
+        handler = MarketDataHandler()
+        handler.market_info = dict(MARKET_INFO, location="La Rochelle, France")
+        self.assertTrue(self.create_overview(handler))
+        self.assertEqual(load_workbook(handler.market_overview_excel_path).active['B3'].value, "La Rochelle, France")
+
+    def test_reassigned_market_info_regenerates(self):
+        handler = MarketDataHandler()
+        self.assertTrue(self.create_overview(handler))
+        handler.market_info = dict(MARKET_INFO, location="La Rochelle, France")
+        self.assertTrue(self.create_overview(handler))
+        self.assertEqual(load_workbook(handler.market_overview_excel_path).active['B3'].value, "La Rochelle, France")
+
+    def test_missing_workbook_or_signature_regenerates(self):
+        self.assertTrue(self.create_overview())
+        os.remove(os.path.join('data', 'market_overview.xlsx'))
+        self.assertTrue(self.create_overview())
+        os.remove(os.path.join('data', 'market_overview.xlsx.sig'))
+        self.assertTrue(self.create_overview())
+        self.assertFalse(self.create_overview())
+
+class TestMarketDataJson(ScratchDirTestCase):
+    def read_json(self, handler):
+        with open(handler.market_data_json_path, 'rb') as f:
+            return f.read()
+
+    def test_compact_layout(self):
+        handler = MarketDataHandler()
+        saved, status = handler.save_market_data(pretty=False)
+        self.assertTrue(saved, status)
+        payload = self.read_json(handler)
+        self.assertNotIn(b'\n', payload)
+        self.assertNotIn(b'": ', payload)
+        self.assertEqual(json.loads(payload), json.loads(json.dumps(dict(MARKET_INFO))))
+        # The stdlib fallback writes the same bytes
+        with mock.patch('src.data.market_data.orjson', None):
+            self.assertEqual(MarketDataHandler()._market_info_json(pretty=False), payload)
+
+    def test_pretty_and_compact_layouts_replace_each_other(self):
+        handler = MarketDataHandler()
+        handler.save_market_data(pretty=False)
+        self.assertIn("saved successfully", handler.save_market_data(pretty=True)[1])
+        self.assertIn(b'\n  "industry"', self.read_json(handler))
+
+    def test_unchanged_json_is_not_rewritten(self):
+        handler = MarketDataHandler()
+        handler.save_market_data()
+        os.utime(handler.market_data_json_path, (1, 1))
+        saved, status = handler.save_market_data()
+        self.assertTrue(saved, status)
+        self.assertIn("already up to date", status)
+        self.assertEqual(os.path.getmtime(handler.market_data_json_path), 1)
+        # A new handler encodes the same bytes, so it skips the write too
+        self.assertIn("already up to date", MarketDataHandler().save_market_data()[1])
+
+    def test_reassigned_market_info_is_saved(self):
+        handler = MarketDataHandler()
+        handler.save_market_data()
+        handler.market_info = dict(MARKET_INFO, location="La Rochelle, France")
+        saved, status = handler.save_market_data()
+        self.assertTrue(saved, status)
+        self.assertEqual(json.loads(self.read_json(handler))['location'], "La Rochelle, France")
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,10 @@
+import os
 import unittest
+import numpy as np
+import pandas as pd
 from src.reports.excel_generator import MarketStudyExcelReport
+from src.reports.powerpoint_generator import MarketStudyPresentation
+from src.test.support import ScratchDirTestCase
 
 class TestExcelReports(unittest.TestCase):
     def setUp(self):
@@ -28,5 +33,26 @@ class TestExcelReports(unittest.TestCase):
         self.assertTrue(self.report.output_filename.endswith(".xlsx"))
         self.assertIn("reports", self.report.output_filename)
 
+class TestPowerPointTables(ScratchDirTestCase):
+    def table_texts(self, df):
+        """Adds a table slide for df and returns the text of every cell, header row first."""
+        presentation = MarketStudyPresentation()
+        presentation._add_table_slide("Test", df)
+        table = next(shape for shape in presentation.prs.slides[-1].shapes if shape.has_table).table
+        return [[cell.text for cell in row.cells] for row in table.rows]
+
+    def test_missing_values_are_empty_cells(self):
+        df = pd.DataFrame({"Competitor": ["A", "B"], "Market Position": ["Leader", np.nan], "Share": [1.5, None]})
+        self.assertEqual(self.table_texts(df), [
+            ["Competitor", "Market Position", "Share"],
+            ["A", "Leader", "1.5"],
+            ["B", "", ""]
+        ])
+
+    def test_rows_follow_frame_order_for_any_index(self):
+        df = pd.DataFrame({"Competitor": ["A", "B", "C"]}, index=[10, 3, 7])
+        self.assertEqual(self.table_texts(df), [["Competitor"], ["A"], ["B"], ["C"]])
+        self.assertEqual(self.table_texts(df.iloc[1:]), [["Competitor"], ["B"], ["C"]])
+
 if __name__ == '__main__':
     unittest.main()